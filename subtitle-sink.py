@@ -1,17 +1,102 @@
 import configparser
+import contextlib
+import errno
+import functools
 import logging
+import multiprocessing
 import os
+import re
 import shutil
 import sys
-from dataclasses import dataclass
+import threading
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from logging.config import dictConfig
-from time import sleep
-from typing import List, Optional
+from time import monotonic
+from typing import Dict, List, Optional, Set, Tuple
 
 from guessit import guessit
-from watchdog.events import PatternMatchingEventHandler
+from watchdog.events import FileSystemEventHandler
 from watchdog.observers import Observer
 
+# Fast path for the common `Show.Name.S01E02...` naming scheme so we can skip guessit for most files
+_EP_RE = re.compile(
+    r"^(?P<title>.+?)[. _-]+[Ss](?P<s>\d{1,2})[Ee](?P<e>\d{1,3})", re.IGNORECASE
+)
+
+# Year and country tags release names add after the show name (`Doctor.Who.2005`, `The.Office.US`)
+_TITLE_TAG_RE = re.compile(r"[. _-]+\(?(?:(?:19|20)\d\d|US|UK|GB|AU|CA|NZ)\)?$")
+
+# Release group prefix like `[Group] Show Name - S01E02`
+_GROUP_TAG_RE = re.compile(r"^\[[^\]]*\][. _-]*")
+
+# Cheap check for an episode marker so obvious non-episodes never reach guessit. Accepted formats:
+#  - S01E02, S01.E02, S01 E02
+#  - 1x02
+#  - Season 1 / Episode 2 / Ep 2 (any separator)
+#  - 102 (3 digit season + episode numbering, but not resolutions like 720p)
+_EP_GATE = re.compile(
+    r"s\d{1,2}[. _-]?e\d{1,3}"
+    r"|(?<![a-z0-9])\d{1,2}x\d{1,3}(?![0-9])"
+    r"|(?<![a-z0-9])(?:season|episode|ep)[. _-]*\d{1,3}(?![0-9])"
+    r"|(?<![a-z0-9])\d{3}(?![0-9pi])",
+    re.IGNORECASE,
+)
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+_SUBTITLE_SUFFIXES = (".srt", ".sbv", ".sub")
+
+SEASON_DIRECTORY_TTL = 60
+
+# Minimum time between rescans of TVDirs triggered by show lookup misses
+SHOW_INDEX_REFRESH_INTERVAL = 60
+
+_log = logging.getLogger(__name__)
+
+# Guessit is pure python and holds the GIL for the whole parse. While full_process drains the
+#  startup backlog with several threads the parsing is done in worker processes instead.
+_guessit_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _init_guessit():
+    # Guessit builds its rule set on first use, do it once per worker up front
+    guessit("Show.S01E01.mkv")
+
+
+def _guessit_worker(name: str):
+    return dict(guessit(name))
+
+
+def start_guessit_pool():
+    global _guessit_pool
+
+    # Spawn the workers since forking a process which is already running threads is unsafe
+    _guessit_pool = ProcessPoolExecutor(
+        max_workers=2,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_guessit,
+    )
+
+
+def stop_guessit_pool():
+    global _guessit_pool
+
+    if _guessit_pool is not None:
+        _guessit_pool.shutdown()
+        _guessit_pool = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _guess(name: str):
+    # Season directories get re-listed on every subtitle so cache the parse results. Guessit
+    #  does not care about the directory part so the basename is a good enough cache key.
+    if _guessit_pool is None:
+        return guessit(name)
+
+    return _guessit_pool.submit(_guessit_worker, name).result()
+
 
 @dataclass
 class Config:
@@ -19,6 +104,101 @@ class Config:
     TVDirs: List[str]
     SeasonFormat: str
     LogFile: Optional[str]
+    # Maps show directory paths to their lowercased names, kept up to date by ShowDirectoryEventHandler
+    show_index: Dict[str, str]
+    # Maps lowercased alphanumeric tokens of show directory names to the show directory paths
+    show_by_token: Dict[str, List[str]]
+    # Device ids used to decide whether subtitles can be renamed into place instead of copied
+    source_device: Optional[int]
+    tv_dir_devices: Dict[str, Optional[int]]
+    # SeasonFormat pre-rendered for the usual season numbers
+    season_names: Dict[int, str]
+    # When TVDirs were last scanned, see refresh_show_index
+    show_index_scanned_at: float = 0.0
+    show_index_lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+
+def get_device(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return None
+
+
+def scan_show_directories(tv_dir: str) -> Dict[str, str]:
+    with os.scandir(tv_dir) as entries:
+        return {entry.path: entry.name.lower() for entry in entries if entry.is_dir()}
+
+
+def build_show_index(tv_dirs: List[str]) -> Dict[str, str]:
+    show_index = {}
+
+    if not tv_dirs:
+        return show_index
+
+    # TV dirs are often separate network mounts so list them concurrently instead of paying
+    #  for each mount's latency one after another
+    with ThreadPoolExecutor(max_workers=min(8, len(tv_dirs))) as pool:
+        for tv_dir_index in pool.map(scan_show_directories, tv_dirs):
+            show_index.update(tv_dir_index)
+
+    return show_index
+
+
+def tokenize(name: str) -> Set[str]:
+    return set(_TOKEN_RE.findall(name.lower()))
+
+
+def build_show_token_index(show_index: Dict[str, str]) -> Dict[str, List[str]]:
+    show_by_token = defaultdict(list)
+
+    for show_path, show_name in show_index.items():
+        for token in tokenize(show_name):
+            show_by_token[token].append(show_path)
+
+    return dict(show_by_token)
+
+
+def add_show_directory(cfg: Config, show_path: str):
+    remove_show_directory(cfg, show_path)
+
+    show_name = os.path.basename(show_path).lower()
+    cfg.show_index[show_path] = show_name
+
+    for token in tokenize(show_name):
+        cfg.show_by_token.setdefault(token, []).append(show_path)
+
+
+def remove_show_directory(cfg: Config, show_path: str):
+    show_name = cfg.show_index.pop(show_path, None)
+
+    if show_name is None:
+        return
+
+    for token in tokenize(show_name):
+        show_paths = cfg.show_by_token.get(token, [])
+
+        if show_path in show_paths:
+            show_paths.remove(show_path)
+
+
+def refresh_show_index(cfg: Config):
+    # Lookups for shows which are not in the library miss every time, so rescan at most once per
+    #  SHOW_INDEX_REFRESH_INTERVAL. Concurrent misses wait for the rescan that is already running.
+    with cfg.show_index_lock:
+        now = monotonic()
+
+        if now - cfg.show_index_scanned_at < SHOW_INDEX_REFRESH_INTERVAL:
+            return
+
+        cfg.show_index_scanned_at = now
+
+        show_index = build_show_index(cfg.TVDirs)
+
+        cfg.show_index = show_index
+        cfg.show_by_token = build_show_token_index(show_index)
 
 
 def load_config(cfg_file):
@@ -45,26 +225,60 @@ def load_config(cfg_file):
 
     for tv_dir in tv_dirs:
         if not os.path.exists(tv_dir):
-            logging.error(f"TV Dir {tv_dir} does not exist. Ignoring")
+            _log.error("TV Dir %s does not exist. Ignoring", tv_dir)
             continue
 
         valid_tv_dirs.append(tv_dir)
 
+    show_index = build_show_index(valid_tv_dirs)
+
     return Config(
         SourceDir=source_dir,
         TVDirs=valid_tv_dirs,
         SeasonFormat=season_format,
         LogFile=cfg.get("Default", "LogFile", fallback=""),
+        show_index=show_index,
+        show_by_token=build_show_token_index(show_index),
+        source_device=get_device(source_dir),
+        tv_dir_devices={
+            os.path.normpath(tv_dir): get_device(tv_dir) for tv_dir in valid_tv_dirs
+        },
+        season_names={nr: season_format.format(nr=nr) for nr in range(1, 51)},
+        show_index_scanned_at=monotonic(),
     )
 
 
 def detect_tv_episode_info(path: str):
-    logging.info(f"Got subtitle file {path}")
+    _log.info("Got subtitle file %s", path)
+
+    filename = os.path.basename(path)
+    fast_match = _EP_RE.search(filename)
 
-    match = guessit(path)
+    if fast_match:
+        title = _GROUP_TAG_RE.sub("", fast_match.group("title"))
+
+        while True:
+            stripped_title = _TITLE_TAG_RE.sub("", title)
+
+            if stripped_title == title:
+                break
+
+            title = stripped_title
+
+        return (
+            re.sub(r"[._]+", " ", title).strip(),
+            int(fast_match.group("s")),
+            int(fast_match.group("e")),
+        )
+
+    if _EP_GATE.search(filename) is None:
+        _log.warning("Tv show not detected. Skipping file %s", path)
+        return
+
+    match = _guess(filename)
 
     if match["type"] != "episode":
-        logging.warning(f"Tv show not detected. Skipping file {path}")
+        _log.warning("Tv show not detected. Skipping file %s", path)
         return
 
     title = match["title"]
@@ -74,140 +288,482 @@ def detect_tv_episode_info(path: str):
     return title, season, episode
 
 
-def find_show_directory(cfg: Config, title: str, season: int):
-    matches = []
+def match_show_directories(cfg: Config, title: str) -> List[str]:
+    lower_title = title.lower()
+    title_tokens = tokenize(lower_title)
+    candidates = None
 
-    for tv_dir in cfg.TVDirs:
-        for sub in os.listdir(tv_dir):
-            sub_path = os.path.join(tv_dir, sub)
+    # Shows whose directory name contains every token of the title
+    for token in title_tokens:
+        token_matches = set(cfg.show_by_token.get(token, ()))
+        candidates = token_matches if candidates is None else candidates & token_matches
 
-            if not os.path.isdir(sub_path):
-                continue
+        if not candidates:
+            break
+
+    substring_matches = []
+    token_matches = []
+
+    # Sharing tokens alone is not enough since short tokens (e.g. the `t` in `Don't`) match a
+    #  lot of unrelated titles. Candidates must contain the title as is or consist of exactly
+    #  the same tokens. Directories containing the title as is are preferred.
+    for sub_path in sorted(candidates or ()):
+        sub_name = cfg.show_index.get(sub_path, "")
+
+        if lower_title in sub_name:
+            substring_matches.append(sub_path)
+        elif tokenize(sub_name) == title_tokens:
+            token_matches.append(sub_path)
+
+    matches = substring_matches or token_matches
+
+    if not matches:
+        # Matching logic might need improvements but this currently works for my media library
+        matches = [
+            sub_path
+            for sub_path, sub_name in list(cfg.show_index.items())
+            if lower_title in sub_name
+        ]
+
+    return matches
+
+
+def match_show_directories_for_file(
+    cfg: Config, title: str, filename: Optional[str]
+) -> Tuple[List[str], str]:
+    """Returns the matching show directories and the title which matched them"""
+    matches = match_show_directories(cfg, title)
+
+    if not matches and filename is not None:
+        # The title from the fast path can still contain tags which guessit knows to strip
+        match = _guess(filename)
+
+        if (
+            match.get("type") == "episode"
+            and match.get("title")
+            and match["title"].lower() != title.lower()
+        ):
+            guessed_title = match["title"]
+            guessed_matches = match_show_directories(cfg, guessed_title)
+
+            if guessed_matches:
+                return guessed_matches, guessed_title
+
+    return matches, title
+
+
+def find_show_directory(
+    cfg: Config, title: str, season: int, filename: Optional[str] = None
+) -> Optional[Tuple[str, str]]:
+    """Returns the show directory together with the title it was found with"""
+    matches, matched_title = match_show_directories_for_file(cfg, title, filename)
 
-            # Matching logic might need improvements but this currently works for my media library
-            if title.lower() in sub.lower():
-                matches.append(sub_path)
+    if not matches:
+        # Inotify does not report changes other hosts make on network mounts, so make sure the
+        #  show directory was not created behind our back before giving up
+        refresh_show_index(cfg)
+        matches, matched_title = match_show_directories_for_file(cfg, title, filename)
 
     if len(matches) == 1:
-        return matches[0]
+        return matches[0], matched_title
 
     if len(matches) > 1:
-        logging.warning(
-            f"Ignoring subtitle. Found multiple possible target dirs for show {title}: {', '.join(matches)}"
+        _log.warning(
+            "Ignoring subtitle. Found multiple possible target dirs for show %s: %s",
+            title,
+            ", ".join(matches),
         )
         return None
 
     if len(matches) == 0:
-        logging.error(f"Target directory for show {title} not found. Ignoring subtitle")
+        _log.error("Target directory for show %s not found. Ignoring subtitle", title)
         return None
 
 
+@functools.lru_cache(maxsize=512)
+def _season_dir(show_directory: str, season_name: str, ttl_bucket: int):
+    season_directory = os.path.join(show_directory, season_name)
+
+    return season_directory if os.path.isdir(season_directory) else None
+
+
+def find_season_directory(show_directory: str, season_name: str) -> Optional[str]:
+    # Results (including missing directories) are cached and refreshed every
+    #  SEASON_DIRECTORY_TTL seconds so newly created season directories get picked up
+    return _season_dir(
+        show_directory, season_name, int(monotonic() // SEASON_DIRECTORY_TTL)
+    )
+
+
+def is_episode_file(episode_filename: str, season: int, episode: int):
+    fast_match = _EP_RE.search(episode_filename)
+
+    if fast_match:
+        return (
+            int(fast_match.group("s")) == season
+            and int(fast_match.group("e")) == episode
+        )
+
+    match = _guess(episode_filename)
+
+    return (
+        match["type"] == "episode"
+        and match["season"] == season
+        and match["episode"] == episode
+    )
+
+
 def find_episode_file(season_directory: str, title: str, season: int, episode: int):
-    for episode_filename in os.listdir(season_directory):
-        full_path = os.path.join(episode_filename)
+    target_tag = f"s{season:02d}e{episode:02d}"
+    other_filenames = []
 
-        match = guessit(full_path)
+    with os.scandir(season_directory) as entries:
+        for entry in entries:
+            episode_filename = entry.name
 
-        if (
-            match["type"] == "episode"
-            and match["season"] == season
-            and match["episode"] == episode
-        ):
-            return full_path, "exact"
+            # Check files which contain the SxxEyy tag first, usually this finds the episode
+            #  with a single parse
+            if target_tag not in episode_filename.lower():
+                other_filenames.append(episode_filename)
+                continue
+
+            if is_episode_file(episode_filename, season, episode):
+                return episode_filename, "exact"
+
+    for episode_filename in other_filenames:
+        if is_episode_file(episode_filename, season, episode):
+            return episode_filename, "exact"
 
     # No exact episode match found. Fall back to using the default naming scheme
     return f"{title} - S{season:02d}E{episode:02d}.mkv", "fallback"
 
 
+def copy_file(source_path: str, target_path: str):
+    # copy_file_range lets the kernel copy (or reflink on CoW filesystems) the data without passing
+    #  it through userspace. It is only available on Linux and Python 3.8+ and plenty of kernels and
+    #  filesystems refuse it, so fall back to shutil.copyfile whenever it is not usable.
+    if hasattr(os, "copy_file_range"):
+        with open(source_path, "rb") as source:
+            target_opened = False
+            total_copied = 0
+
+            try:
+                with open(target_path, "wb") as target:
+                    target_opened = True
+                    remaining = os.fstat(source.fileno()).st_size
+
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            source.fileno(), target.fileno(), remaining
+                        )
+
+                        if copied == 0:
+                            # Some filesystems report 0 instead of failing
+                            break
+
+                        total_copied += copied
+                        remaining -= copied
+
+                if remaining == 0:
+                    return
+            except OSError as e:
+                # Same rule as shutil's own fast copy: any error before the first byte was copied
+                #  means copy_file_range is not usable here, except for running out of space
+                if total_copied or e.errno == errno.ENOSPC:
+                    # Don't leave a truncated subtitle file behind
+                    if target_opened:
+                        with contextlib.suppress(OSError):
+                            os.unlink(target_path)
+
+                    raise
+
+    shutil.copyfile(source_path, target_path)
+
+
+def move_file(cfg: Config, source_path: str, target_path: str, tv_dir: str):
+    target_device = cfg.tv_dir_devices.get(tv_dir)
+
+    # Only skip the rename when we know for sure that it would fail with EXDEV
+    if (
+        cfg.source_device is None
+        or target_device is None
+        or cfg.source_device == target_device
+    ):
+        try:
+            os.rename(source_path, target_path)
+            return
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+
+    copy_file(source_path, target_path)
+
+    # Unlink the original file so it won't be processed again
+    os.unlink(source_path)
+
+
 def process_subtitle_file(subtitle_path: str, cfg: Config):
     tv_info = detect_tv_episode_info(subtitle_path)
 
     if tv_info:
         title, season, episode = tv_info
-        sub_extension = os.path.splitext(subtitle_path)[1]
+        # Only files with a subtitle suffix end up here so the last dot always starts the extension
+        sub_extension = "." + subtitle_path.rpartition(".")[2]
 
-        show_directory = find_show_directory(cfg, title, season)
+        show_match = find_show_directory(
+            cfg, title, season, os.path.basename(subtitle_path)
+        )
 
-        if show_directory is None:
+        if show_match is None:
             return
 
-        season_directory = os.path.join(
-            show_directory, cfg.SeasonFormat.format(nr=season)
-        )
+        # Use the title the show was found with, it can be cleaner than the detected one
+        show_directory, title = show_match
+
+        # Guessit returns a list of seasons for multi-season names, those are not in season_names
+        season_name = None
+
+        if isinstance(season, int):
+            season_name = cfg.season_names.get(season)
+
+        if season_name is None:
+            season_name = cfg.SeasonFormat.format(nr=season)
 
-        if not os.path.exists(season_directory) or not os.path.isdir(season_directory):
-            logging.error(
-                f"Directory for Season {season} does not exist (path tried: {season_directory})"
+        season_directory = find_season_directory(show_directory, season_name)
+
+        if season_directory is None:
+            _log.error(
+                "Directory for Season %s does not exist (path tried: %s)",
+                season,
+                os.path.join(show_directory, season_name),
             )
             return
 
         episode_filename, confidence = find_episode_file(
             season_directory, title, season, episode
         )
-        base_name, extension = os.path.splitext(episode_filename)
+        base_name = os.path.splitext(episode_filename)[0]
         subtitle_filename = f"{base_name}{sub_extension}"
 
         target_path = os.path.join(season_directory, subtitle_filename)
 
-        logging.info(
-            f"Will create subtitle file {subtitle_filename} [{confidence} match]. Target: {target_path}"
+        _log.info(
+            "Will create subtitle file %s [%s match]. Target: %s",
+            subtitle_filename,
+            confidence,
+            target_path,
         )
 
-        # Copy the subtitle file to target dir
-        shutil.copy(subtitle_path, target_path)
+        # Move the subtitle file to target dir
+        try:
+            move_file(
+                cfg,
+                subtitle_path,
+                target_path,
+                os.path.dirname(os.path.normpath(show_directory)),
+            )
+        except FileNotFoundError:
+            if os.path.exists(subtitle_path):
+                raise
 
-        # Unlink the original file so it won't be processed again
-        os.unlink(subtitle_path)
+            # The subtitle file no longer exists. This usually occurs when we process a subtitle file
+            #  and then remove it ourselves and a stale event for it arrives afterwards.
+            _log.info("File %s no longer exists. Skipping", subtitle_path)
+            return
 
-        logging.info(f"File {subtitle_path} removed from sink")
+        _log.info("File %s removed from sink", subtitle_path)
+
+        return True
 
 
 def is_subtitle_file(file_path):
-    return (
-        file_path.endswith(".srt")
-        or file_path.endswith(".sbv")
-        or file_path.endswith(".sub")
-    )
+    return file_path.endswith(_SUBTITLE_SUFFIXES)
+
 
+class SubtitleFileEventHandler(FileSystemEventHandler):
+    # A single file write usually produces a burst of created/modified events. Paths are queued
+    #  and only processed once no new events have arrived for them for SETTLE_DELAY seconds.
+    SETTLE_DELAY = 0.2
+    # How long events for a path we just moved out of the sink are considered stale
+    UNLINKED_TTL = 5 * SETTLE_DELAY
+    UNLINKED_MAX = 64
 
-class SubtitleFileEventHandler(PatternMatchingEventHandler):
     def __init__(self, cfg: Config, *args, **kwargs):
         self.cfg = cfg
 
+        self._pending: Dict[str, float] = {}
+        # Guards the handler state and wakes up the worker when paths are queued or it is stopped
+        self._pending_changed = threading.Condition()
+        self._stopped = False
+        self._worker = threading.Thread(target=self._process_pending, daemon=True)
+
+        # Paths we have recently moved out of the sink ourselves (oldest first) mapped to the time
+        #  of the move. Stale modified events for those are dropped without touching the filesystem.
+        self._recently_unlinked: Dict[str, float] = {}
+
         super().__init__(*args, **kwargs)
 
-    def process(self, event):
+        self._worker.start()
+
+    def stop(self):
+        with self._pending_changed:
+            self._stopped = True
+            self._pending_changed.notify()
+
+        self._worker.join()
+
+    def dispatch(self, event):
+        # Directories are never subtitles, skip them before any per-event work is done
+        if event.is_directory:
+            return
+
+        super().dispatch(event)
+
+    def queue(self, event):
         if event.event_type != "modified" and event.event_type != "created":
             return
 
-        if not os.path.exists(event.src_path):
-            # Skip the event since the file does not exist. This usually occurs when we process a subtitle file
-            #  and then remove it ourselves. Having the check here avoids attempts to reimport it after the deletion.
+        if not is_subtitle_file(event.src_path):
             return
 
-        if is_subtitle_file(event.src_path):
-            process_subtitle_file(event.src_path, self.cfg)
+        self._queue_path(event.src_path, event.event_type == "created")
+
+    def _queue_path(self, path: str, is_new_file: bool):
+        now = monotonic()
+
+        with self._pending_changed:
+            unlinked_at = self._recently_unlinked.get(path)
+
+            if unlinked_at is not None:
+                if not is_new_file and now - unlinked_at <= self.UNLINKED_TTL:
+                    return
+
+                # Either a new file was dropped into the sink with the same name or the entry is old
+                #  enough that the event can't be about the file we moved
+                del self._recently_unlinked[path]
+
+            self._pending[path] = now
+            self._pending_changed.notify()
+
+    def _note_unlinked(self, path: str):
+        now = monotonic()
+
+        with self._pending_changed:
+            self._recently_unlinked.pop(path, None)
+            self._recently_unlinked[path] = now
+
+            # Drop expired entries and keep the size bounded, dicts keep the insertion order
+            for old_path, unlinked_at in list(self._recently_unlinked.items()):
+                if (
+                    now - unlinked_at <= self.UNLINKED_TTL
+                    and len(self._recently_unlinked) <= self.UNLINKED_MAX
+                ):
+                    break
+
+                del self._recently_unlinked[old_path]
+
+    def _take_ready(self) -> Optional[List[str]]:
+        with self._pending_changed:
+            while not self._stopped:
+                now = monotonic()
+                ready = [
+                    path
+                    for path, last_seen in self._pending.items()
+                    if last_seen + self.SETTLE_DELAY <= now
+                ]
+
+                if ready:
+                    for path in ready:
+                        del self._pending[path]
+
+                    return ready
+
+                # Sleep until the oldest pending path settles, or until something is queued
+                timeout = None
+
+                if self._pending:
+                    timeout = min(self._pending.values()) + self.SETTLE_DELAY - now
+
+                self._pending_changed.wait(timeout)
+
+        return None
+
+    def _process_pending(self):
+        while True:
+            ready = self._take_ready()
+
+            if ready is None:
+                return
+
+            for path in ready:
+                try:
+                    if process_subtitle_file(path, self.cfg):
+                        self._note_unlinked(path)
+                except Exception:
+                    _log.exception("Failed to process subtitle file %s", path)
 
     def on_modified(self, event):
-        self.process(event)
+        self.queue(event)
 
     def on_created(self, event):
-        self.process(event)
+        self.queue(event)
+
+    def on_moved(self, event):
+        # Download clients and rsync write to a temporary name and rename the file into place
+        #  once it is complete
+        if is_subtitle_file(event.dest_path):
+            self._queue_path(event.dest_path, True)
+
+
+class ShowDirectoryEventHandler(FileSystemEventHandler):
+    """Keeps the show indexes in cfg in sync with the show directories inside TVDirs"""
+
+    def __init__(self, cfg: Config, *args, **kwargs):
+        self.cfg = cfg
+
+        super().__init__(*args, **kwargs)
+
+    def on_created(self, event):
+        if event.is_directory:
+            add_show_directory(self.cfg, event.src_path)
+
+    def on_deleted(self, event):
+        remove_show_directory(self.cfg, event.src_path)
+
+    def on_moved(self, event):
+        remove_show_directory(self.cfg, event.src_path)
+
+        if event.is_directory:
+            add_show_directory(self.cfg, event.dest_path)
 
 
 def full_process(cfg):
-    for path in os.listdir(cfg.SourceDir):
-        full_path = os.path.join(cfg.SourceDir, path)
+    with os.scandir(cfg.SourceDir) as entries:
+        subtitle_paths = [
+            entry.path for entry in entries if is_subtitle_file(entry.path)
+        ]
 
-        if not is_subtitle_file(full_path):
-            continue
+    if not subtitle_paths:
+        return
+
+    start_guessit_pool()
+
+    try:
+        # Subtitles are independent of each other so drain the startup backlog concurrently
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            process = functools.partial(process_subtitle_file, cfg=cfg)
 
-        process_subtitle_file(full_path, cfg)
+            for _ in pool.map(process, subtitle_paths):
+                pass
+    finally:
+        stop_guessit_pool()
 
 
 def main(cfg_file_path: str):
     logging_cfg = dict(
         version=1,
+        # Keep the module logger created at import time enabled
+        disable_existing_loggers=False,
         formatters={"f": {"format": "%(asctime)s [%(levelname)s] %(message)s"}},
         handlers={
             "default": {
@@ -236,21 +792,32 @@ def main(cfg_file_path: str):
         dictConfig(logging_cfg)
 
     if not os.path.exists(cfg.SourceDir) or not os.path.isdir(cfg.SourceDir):
-        logging.error(f"Source path {cfg.SourceDir} does not exist")
+        _log.error("Source path %s does not exist", cfg.SourceDir)
         return 1
 
     full_process(cfg)
 
     observer = Observer()
-    observer.schedule(SubtitleFileEventHandler(cfg), cfg.SourceDir, recursive=True)
+    subtitle_handler = SubtitleFileEventHandler(cfg)
+    # Only the top level of SourceDir is watched, same as what full_process looks at
+    observer.schedule(subtitle_handler, cfg.SourceDir, recursive=False)
+
+    show_handler = ShowDirectoryEventHandler(cfg)
+
+    for tv_dir in cfg.TVDirs:
+        observer.schedule(show_handler, tv_dir, recursive=False)
+
     observer.start()
 
     try:
-        while True:
-            sleep(1)
+        # Block until the observer thread exits instead of waking up periodically
+        observer.join()
+    except KeyboardInterrupt:
+        pass
     finally:
         observer.stop()
         observer.join()
+        subtitle_handler.stop()
         return 0
 
 